@@ -0,0 +1,6 @@
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-isoview-cache",
+        action="store_true",
+        help="Fetch reference listings from the API instead of the on-disk response cache.",
+    )
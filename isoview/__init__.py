@@ -1 +1 @@
-from .client import Client, clear_cache
+from .client import AsyncClient, Client, clear_cache
@@ -1,42 +1,119 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import importlib.util
 import json
+import math
 import os
 import re
 import tempfile
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _CACHE_TTL = 3600  # 1 hour
 
+# Transient gateway errors are retried with exponential backoff by both clients
+_RETRY_STATUSES = (502, 503, 504)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+
 
 def _load_spec(base_url: str, session: requests.Session) -> dict:
     cache_key = hashlib.md5(base_url.encode()).hexdigest()
     cache_path = os.path.join(tempfile.gettempdir(), f"isoview_spec_{cache_key}.json")
 
-    if os.path.exists(cache_path):
-        age = time.time() - os.path.getmtime(cache_path)
-        if age < _CACHE_TTL:
+    # The file can vanish (clear_cache in another process) or be unreadable; refetch then
+    try:
+        if time.time() - os.path.getmtime(cache_path) < _CACHE_TTL:
             with open(cache_path) as f:
                 return json.load(f)
+    except (OSError, ValueError):
+        pass
 
     resp = session.get(f"{base_url}/openapi.json")
     resp.raise_for_status()
     spec = resp.json()
-    with open(cache_path, "w") as f:
-        json.dump(spec, f)
+    _write_atomic(cache_path, json.dumps(spec).encode())
     return spec
 
 
+def _write_atomic(path: str, content: bytes) -> None:
+    # Write to a sibling temp file and rename, so concurrent processes never read a partial file
+    fd, tmp_path = tempfile.mkstemp(prefix="isoview_", suffix=".tmp", dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
 def clear_cache() -> None:
-    """Delete all cached OpenAPI spec files, forcing a fresh fetch on next Client init."""
+    """Delete all cached OpenAPI spec files and API responses, forcing a fresh fetch on next use."""
     import glob as _glob
-    for path in _glob.glob(os.path.join(tempfile.gettempdir(), "isoview_spec_*.json")):
-        os.remove(path)
+    for pattern in ("isoview_spec_*.json", "isoview_response_*.json"):
+        for path in _glob.glob(os.path.join(tempfile.gettempdir(), pattern)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # already removed by a concurrent clear_cache
+
+
+_RESPONSE_TTL_LATEST = 60  # 1 minute; "latest" forecasts change as new runs land
+_RESPONSE_TTL_LIST = 30 * 24 * 3600  # 30 days; reference listings rarely change
+_HISTORICAL_PARAM_NAMES = ("forecasted_by", "as_of", "end")
+_END_SETTLE = pd.Timedelta(days=1)  # backcast data keeps landing for a while after a window ends
+
+
+def _response_cache_path(api_key: str, url: str, params: dict | None) -> str:
+    raw = json.dumps([api_key, url, sorted((params or {}).items())], default=str)
+    cache_key = hashlib.md5(raw.encode()).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f"isoview_response_{cache_key}.json")
+
+
+def _response_ttl(params: dict | None, is_list: bool) -> float:
+    if is_list:
+        return _RESPONSE_TTL_LIST
+    # A response pinned to a point in the past (forecasted_by/as_of, or a window
+    # that ended more than _END_SETTLE ago) can no longer change, so it never expires.
+    now = pd.Timestamp.now(tz="UTC")
+    for name in _HISTORICAL_PARAM_NAMES:
+        value = (params or {}).get(name)
+        if value is None:
+            continue
+        try:
+            ts = pd.Timestamp(value)
+        except ValueError:
+            continue
+        if ts.tzinfo is None:
+            ts = ts.tz_localize("UTC")
+        if ts < (now - _END_SETTLE if name == "end" else now):
+            return math.inf
+    return _RESPONSE_TTL_LATEST
+
+
+def _json_loads(content: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which only the stdlib parser accepts
+    return json.loads(content)
 
 
 def _to_snake_case(summary: str) -> str:
@@ -44,11 +121,24 @@ def _to_snake_case(summary: str) -> str:
 
 
 def _dt(value: datetime | str | None) -> str | None:
-    if isinstance(value, datetime):
+    # Strings and None are the common case; identity checks skip the isinstance MRO walk
+    cls = type(value)
+    if value is None or cls is str:
+        return value
+    if cls is datetime or cls is pd.Timestamp or isinstance(value, datetime):
         return value.isoformat()
     return value
 
 
+def _to_datetime(value: date | str) -> datetime:
+    if isinstance(value, str):
+        return _parse_iso(value)
+    if not isinstance(value, datetime):
+        # A plain date means midnight, so it can be compared with datetime bounds
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
 def _resolve_ref(schema: dict, schemas: dict) -> dict:
     ref = schema.get("$ref")
     if ref:
@@ -68,27 +158,85 @@ def _is_timeseries_schema(schema: dict) -> bool:
     return "time_utc" in props
 
 
+def _has_datetimes(schema: dict, schemas: dict, seen: frozenset = frozenset()) -> bool:
+    if schema.get("format") == "date-time":
+        return True
+    children = list(schema.get("properties", {}).values())
+    if schema.get("type") == "array":
+        children.append(schema.get("items", {}))
+    for child in children:
+        ref = child.get("$ref")
+        if ref in seen:
+            continue
+        if _has_datetimes(_resolve_ref(child, schemas), schemas, seen | {ref} if ref else seen):
+            return True
+    return False
+
+
+def _resolve_properties(schema: dict, schemas: dict) -> dict:
+    # Only keep properties that can hold date-times, so e.g. the values matrix is never walked
+    props = {key: _resolve_ref(prop, schemas) for key, prop in schema.get("properties", {}).items()}
+    return {key: prop for key, prop in props.items() if _has_datetimes(prop, schemas)}
+
+
 def _parse_datetimes(data, schema: dict, schemas: dict):
     if isinstance(data, list) and schema.get("type") == "array":
         item_schema = _resolve_ref(schema.get("items", {}), schemas)
+        if not _has_datetimes(item_schema, schemas):
+            return data
+        if item_schema.get("properties"):
+            # Resolve the item properties once for the whole list rather than once per item
+            props = _resolve_properties(item_schema, schemas)
+            return [_parse_object(item, props, schemas) if isinstance(item, dict) else item for item in data]
         return [_parse_datetimes(item, item_schema, schemas) for item in data]
 
     if isinstance(data, dict):
-        props = schema.get("properties", {})
-        for key, value in data.items():
-            if key not in props:
-                continue
-            prop_schema = _resolve_ref(props[key], schemas)
-            if prop_schema.get("format") == "date-time" and isinstance(value, str):
-                data[key] = datetime.fromisoformat(value)
-            elif prop_schema.get("type") == "array":
-                item_schema = _resolve_ref(prop_schema.get("items", {}), schemas)
-                if item_schema.get("format") == "date-time":
-                    data[key] = [datetime.fromisoformat(v) for v in value if isinstance(v, str)]
-                else:
-                    data[key] = _parse_datetimes(value, prop_schema, schemas)
-            elif prop_schema.get("type") == "object":
+        return _parse_object(data, _resolve_properties(schema, schemas), schemas)
+    return data
+
+
+# Timeseries axes are parsed in one vectorized call; other date-time arrays stay lists of datetimes
+_TIMESERIES_AXES = frozenset({"time_utc", "time_local"})
+
+
+def _parse_object(data: dict, props: dict, schemas: dict) -> dict:
+    for key, value in data.items():
+        prop_schema = props.get(key)
+        if prop_schema is None:
+            continue
+        if prop_schema.get("format") == "date-time" and isinstance(value, str):
+            data[key] = _parse_iso(value)
+        elif prop_schema.get("type") == "array":
+            item_schema = _resolve_ref(prop_schema.get("items", {}), schemas)
+            if item_schema.get("format") == "date-time" and key in _TIMESERIES_AXES:
+                data[key] = pd.to_datetime(value, format="ISO8601", utc=True)
+            elif item_schema.get("format") == "date-time":
+                data[key] = [_parse_iso(v) for v in value if isinstance(v, str)]
+            else:
                 data[key] = _parse_datetimes(value, prop_schema, schemas)
+        elif prop_schema.get("type") == "object":
+            data[key] = _parse_datetimes(value, prop_schema, schemas)
+    return data
+
+
+def _values_array(values, n_rows: int) -> np.ndarray:
+    # values is column-major (one list per column); None becomes NaN when numeric
+    try:
+        arr = np.asarray(values, dtype="float64")
+    except (TypeError, ValueError):
+        arr = np.asarray(values, dtype=object)
+    return arr.reshape(len(values), n_rows)
+
+
+def _parse_timeseries(data, schema: dict, schemas: dict):
+    data = _parse_datetimes(data, schema, schemas)
+    if not isinstance(data, dict):
+        return data
+    # Timestamp arrays are parsed to UTC; present the local axis in the series' own timezone
+    if isinstance(data.get("time_local"), pd.DatetimeIndex) and data.get("timezone"):
+        data["time_local"] = data["time_local"].tz_convert(data["timezone"])
+    if "values" in data and "time_utc" in data:
+        data["values"] = _values_array(data["values"], len(data["time_utc"]))
     return data
 
 
@@ -97,31 +245,58 @@ _DF_KEYS = frozenset({"time_utc", "time_local", "values", "columns"})
 
 def _timeseries_to_df(data: dict, utc: bool = True) -> pd.DataFrame:
     if utc:
-        index = pd.DatetimeIndex(data["time_utc"], name="time")
+        index = data["time_utc"].rename("time")
     else:
-        index = pd.to_datetime(data["time_local"], utc=True).tz_convert(data["timezone"])
-        index.name = "time"
-    columns = pd.MultiIndex.from_tuples([tuple(c) for c in data["columns"]])
-    vals = dict(enumerate(data["values"]))
-    df = pd.DataFrame(vals, index=index)
-    df.columns = columns
+        index = data["time_local"].rename("time")
+    columns = pd.MultiIndex.from_arrays(list(zip(*data["columns"])))
+    values = _values_array(data["values"], len(index))
+    df = pd.DataFrame(values.T, index=index, columns=columns, copy=False)
+    if values.dtype == object:
+        df = df.infer_objects()
     df.attrs = {k: v for k, v in data.items() if k not in _DF_KEYS}
     return df
 
 
+def _timeseries_to_arrow(data: dict, utc: bool = True):
+    import pyarrow as pa
+    index = data["time_utc"] if utc else data["time_local"]
+    values = _values_array(data["values"], len(index))
+    arrays = {"time": pa.array(index)}
+    for col, vals in zip(data["columns"], values):
+        name = "_".join(col)
+        # Joined names can collide, e.g. ("pjm_total", "f") and ("pjm", "total_f")
+        if name in arrays:
+            raise ValueError(f"Duplicate Arrow column name {name!r} from column {col}")
+        arrays[name] = pa.array(vals, from_pandas=True)
+    # JSON-encode metadata so Arrow/Parquet consumers can decode it; datetimes as ISO 8601
+    metadata = {k: json.dumps(v, default=_json_default) for k, v in data.items() if k not in _DF_KEYS}
+    return pa.table(arrays, metadata=metadata)
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
 def _merge_timeseries_dicts(chunks: list[dict]) -> dict:
     first = chunks[0]
     merged = {**first}
-    merged["time_utc"] = list(first["time_utc"])
-    merged["time_local"] = list(first["time_local"])
-    merged["values"] = [list(col) for col in first["values"]]
-
-    for chunk in chunks[1:]:
-        skip = 1 if chunk["time_utc"] and merged["time_utc"] and chunk["time_utc"][0] == merged["time_utc"][-1] else 0
-        merged["time_utc"].extend(chunk["time_utc"][skip:])
-        merged["time_local"].extend(chunk["time_local"][skip:])
-        for i, col in enumerate(chunk["values"]):
-            merged["values"][i].extend(col[skip:])
+
+    # One append/concatenate per field, so each merged array is allocated once at its final size
+    time_utc = first["time_utc"].append([chunk["time_utc"] for chunk in chunks[1:]])
+    time_local = first["time_local"].append([chunk["time_local"] for chunk in chunks[1:]])
+    values = np.concatenate([chunk["values"] for chunk in chunks], axis=1)
+
+    # Chunks arrive in time order, so keep only rows that move past every earlier timestamp.
+    # This drops repeated boundary rows however many rows adjacent chunks overlap by.
+    stamps = time_utc.asi8
+    keep = np.ones(len(stamps), dtype=bool)
+    keep[1:] = stamps[1:] > np.maximum.accumulate(stamps)[:-1]
+    if keep.all():
+        merged["time_utc"], merged["time_local"], merged["values"] = time_utc, time_local, values
+    else:
+        merged["time_utc"], merged["time_local"], merged["values"] = time_utc[keep], time_local[keep], values[:, keep]
     return merged
 
 
@@ -139,7 +314,9 @@ def _build_docstring(operation: dict, path_params: list, query_params: list, is_
             lines.append(f"    {p['name']}: {desc}" if desc else f"    {p['name']}")
         if is_timeseries:
             lines.append("    as_df: If True, return a pandas DataFrame instead of a dict.")
-            lines.append("    utc: If True (default), use time_utc for the DataFrame index; if False, use time_local.")
+            lines.append("    as_arrow: If True, return a pyarrow Table instead of a dict (requires pyarrow).")
+            lines.append("    utc: If True (default), use time_utc for the DataFrame index or Arrow time column;")
+            lines.append("        if False, use time_local.")
 
     return "\n".join(lines)
 
@@ -147,6 +324,69 @@ def _build_docstring(operation: dict, path_params: list, query_params: list, is_
 _DATETIME_PARAM_NAMES = frozenset({"start", "end", "forecasted_by", "as_of"})
 
 
+def _prepare_call(args, kwargs, path_template, path_params, query_params, is_timeseries):
+    # Map positional args to path params
+    path_values = {}
+    for i, pp in enumerate(path_params):
+        if i < len(args):
+            path_values[pp["name"]] = args[i]
+        elif pp["name"] in kwargs:
+            path_values[pp["name"]] = kwargs.pop(pp["name"])
+
+    as_df = kwargs.pop("as_df", False) if is_timeseries else False
+    as_arrow = kwargs.pop("as_arrow", False) if is_timeseries else False
+    utc = kwargs.pop("utc", True) if is_timeseries else True
+    if as_df and as_arrow:
+        raise ValueError("as_df and as_arrow are mutually exclusive")
+
+    # Build query params
+    qp = {}
+    for p in query_params:
+        val = kwargs.get(p["name"])
+        if p.get("schema", {}).get("format") == "date-time" or p["name"] in _DATETIME_PARAM_NAMES:
+            val = _dt(val)
+        qp[p["name"]] = val
+
+    return path_template.format(**path_values), qp, (as_df, as_arrow, utc)
+
+
+def _convert_output(data, output: tuple):
+    as_df, as_arrow, utc = output
+    if as_df:
+        return _timeseries_to_df(data, utc=utc)
+    if as_arrow:
+        return _timeseries_to_arrow(data, utc=utc)
+    return data
+
+
+def _chunk_windows(start, end, max_range: timedelta) -> list[tuple[str, str]] | None:
+    start_dt = _to_datetime(start)
+    end_dt = _to_datetime(end)
+    if (start_dt.tzinfo is None) != (end_dt.tzinfo is None):
+        # Mixed naive and aware bounds: read the naive one as UTC, like the API's own timestamps
+        start_dt = start_dt if start_dt.tzinfo else start_dt.replace(tzinfo=timezone.utc)
+        end_dt = end_dt if end_dt.tzinfo else end_dt.replace(tzinfo=timezone.utc)
+    if (end_dt - start_dt) <= max_range:
+        return None
+    # Chunk boundaries are formatted once; each is shared by two adjacent windows
+    bounds = [start_dt]
+    while bounds[-1] < end_dt:
+        bounds.append(min(bounds[-1] + max_range, end_dt))
+    iso_bounds = [b.isoformat() for b in bounds]
+    return list(zip(iso_bounds, iso_bounds[1:]))
+
+
+def _read_cached_response(cache_path: str, max_age: float):
+    # A missing, expired or undecodable entry is a cache miss
+    try:
+        if time.time() - os.path.getmtime(cache_path) >= max_age:
+            return None
+        with open(cache_path, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
 class Client:
     """Python client for the ISOview REST API.
 
@@ -155,24 +395,68 @@ class Client:
     Args:
         api_key: Your ISOview API key.
         base_url: Base URL of the API (default ``https://api.isoview.io/v1``).
+        cache: If True, cache responses on disk. Listings are kept for 30 days,
+            responses pinned to the past (``forecasted_by`` or ``as_of`` before now,
+            or ``end`` more than a day ago) indefinitely, and everything else for
+            1 minute.
+        cache_fallback: If True (and ``cache`` is enabled), return the last cached
+            response, however stale, when the API cannot be reached or still
+            returns 502/503/504 after retries.
     """
 
     _MAX_RANGE = timedelta(days=365)
+    _MAX_WORKERS = 4
 
-    def __init__(self, api_key: str, base_url: str = "https://api.isoview.io/v1"):
+    def __init__(self, api_key: str, base_url: str = "https://api.isoview.io/v1",
+                 cache: bool = False, cache_fallback: bool = False):
         self._api_key = api_key
         self._base_url = base_url
+        self._cache = cache
+        self._cache_fallback = cache_fallback
         self._session = requests.Session()
         self._session.headers["X-API-Key"] = api_key
+        # Keep enough warm connections for concurrent chunk fetches; retry transient gateway errors
+        retry = Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF, status_forcelist=_RETRY_STATUSES,
+                      allowed_methods=("GET",), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._method_names: list[str] = []
 
         spec = _load_spec(base_url, self._session)
         self._build_methods(spec)
 
-    def _get(self, path: str, params: dict | None = None) -> dict | list:
-        resp = self._session.get(f"{self._base_url}{path}", params=params)
+    def _get(self, path: str, params: dict | None = None, is_list: bool = False) -> dict | list:
+        url = f"{self._base_url}{path}"
+        params = {k: v for k, v in (params or {}).items() if v is not None} or None
+        cache_path = _response_cache_path(self._api_key, url, params) if self._cache else None
+        if cache_path:
+            cached = _read_cached_response(cache_path, _response_ttl(params, is_list))
+            if cached is not None:
+                return cached
+
+        try:
+            resp = self._session.get(url, params=params)
+        except (requests.ConnectionError, requests.Timeout):
+            stale = self._read_stale(cache_path)
+            if stale is not None:
+                return stale
+            raise
+        if resp.status_code in _RETRY_STATUSES:
+            # Gateway retries are exhausted, so the API is effectively unreachable
+            stale = self._read_stale(cache_path)
+            if stale is not None:
+                return stale
         resp.raise_for_status()
-        return resp.json()
+        if cache_path:
+            _write_atomic(cache_path, resp.content)
+        return _json_loads(resp.content)
+
+    def _read_stale(self, cache_path: str | None):
+        # Any cached entry, however old, when cache_fallback is on
+        if cache_path and self._cache_fallback:
+            return _read_cached_response(cache_path, math.inf)
+        return None
 
     def _build_methods(self, spec: dict) -> None:
         schemas = spec.get("components", {}).get("schemas", {})
@@ -219,7 +503,7 @@ class Client:
                 resp_schema, schemas,
             )
             method.__name__ = name
-            method.__qualname__ = f"Client.{name}"
+            method.__qualname__ = f"{type(self).__name__}.{name}"
             method.__doc__ = _build_docstring(operation, path_params, query_params, is_timeseries)
             setattr(self, name, method)
             self._method_names.append(name)
@@ -228,80 +512,166 @@ class Client:
                      is_timeseries, is_list, has_chunking, resp_schema, schemas):
 
         def method(*args, **kwargs):
-            # Map positional args to path params
-            path_values = {}
-            for i, pp in enumerate(path_params):
-                if i < len(args):
-                    path_values[pp["name"]] = args[i]
-                elif pp["name"] in kwargs:
-                    path_values[pp["name"]] = kwargs.pop(pp["name"])
-
-            as_df = kwargs.pop("as_df", False) if is_timeseries else False
-            utc = kwargs.pop("utc", True) if is_timeseries else True
-
-            # Build query params
-            qp = {}
-            for p in query_params:
-                val = kwargs.get(p["name"])
-                if val is not None:
-                    if p.get("schema", {}).get("format") == "date-time" or p["name"] in _DATETIME_PARAM_NAMES:
-                        val = _dt(val)
-                    qp[p["name"]] = val
-
-            url_path = path_template.format(**path_values)
+            url_path, qp, output = _prepare_call(args, kwargs, path_template, path_params,
+                                                 query_params, is_timeseries)
 
             if has_chunking and kwargs.get("start") is not None and kwargs.get("end") is not None:
-                return self._chunked_request(url_path, qp, kwargs["start"], kwargs["end"],
-                                             as_df, utc, resp_schema, schemas)
-
-            data = self._get(url_path, qp if qp else None)
-            data = _parse_datetimes(data, resp_schema, schemas)
-
-            if as_df and is_timeseries:
-                return _timeseries_to_df(data, utc=utc)
-            return data
+                data = self._chunked_request(url_path, qp, kwargs["start"], kwargs["end"],
+                                             resp_schema, schemas)
+            else:
+                data = self._get(url_path, qp, is_list=is_list)
+                if is_timeseries:
+                    data = _parse_timeseries(data, resp_schema, schemas)
+                else:
+                    data = _parse_datetimes(data, resp_schema, schemas)
+            return _convert_output(data, output)
 
         return method
 
-    def _chunked_request(self, path, params, start, end, as_df, utc, resp_schema, schemas):
-        start_val = _dt(start)
-        end_val = _dt(end)
-        start_dt = datetime.fromisoformat(start_val) if isinstance(start_val, str) else start_val
-        end_dt = datetime.fromisoformat(end_val) if isinstance(end_val, str) else end_val
-
-        if (end_dt - start_dt) > self._MAX_RANGE:
-            chunks = []
-            chunk_start = start_dt
-            while chunk_start < end_dt:
-                chunk_end = min(chunk_start + self._MAX_RANGE, end_dt)
-                chunk_params = {**params, "start": chunk_start.isoformat(), "end": chunk_end.isoformat()}
-                clean = {k: v for k, v in chunk_params.items() if v is not None}
-                try:
-                    data = self._get(path, clean)
-                except requests.HTTPError as e:
-                    if e.response is not None and e.response.status_code == 422:
-                        chunk_start = chunk_end
-                        continue
-                    raise
-                data = _parse_datetimes(data, resp_schema, schemas)
-                chunks.append(data)
-                chunk_start = chunk_end
-            if not chunks:
-                raise ValueError(f"No data available for the requested time range ({start_dt} to {end_dt})")
-            merged = _merge_timeseries_dicts(chunks)
-            if as_df:
-                return _timeseries_to_df(merged, utc=utc)
-            return merged
-
-        clean = {k: v for k, v in params.items() if v is not None}
-        data = self._get(path, clean if clean else None)
-        data = _parse_datetimes(data, resp_schema, schemas)
-        if as_df:
-            return _timeseries_to_df(data, utc=utc)
-        return data
+    def _chunked_request(self, path, params, start, end, resp_schema, schemas):
+        windows = _chunk_windows(start, end, self._MAX_RANGE)
+        if windows is None:
+            data = self._get(path, params)
+            return _parse_timeseries(data, resp_schema, schemas)
+
+        def fetch(window):
+            try:
+                data = self._get(path, {**params, "start": window[0], "end": window[1]})
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 422:
+                    return None
+                raise
+            return _parse_timeseries(data, resp_schema, schemas)
+
+        # Chunks are independent reads; fetch them concurrently and keep them in time order
+        with ThreadPoolExecutor(max_workers=min(self._MAX_WORKERS, len(windows))) as pool:
+            chunks = [data for data in pool.map(fetch, windows) if data is not None]
+        if not chunks:
+            raise ValueError(f"No data available for the requested time range ({windows[0][0]} to {windows[-1][1]})")
+        return _merge_timeseries_dicts(chunks)
 
     def __dir__(self):
         return sorted(set(super().__dir__() + self._method_names))
 
     def __repr__(self):
-        return f"Client(base_url={self._base_url!r}, methods={len(self._method_names)})"
+        return f"{type(self).__name__}(base_url={self._base_url!r}, methods={len(self._method_names)})"
+
+
+class AsyncClient(Client):
+    """Asynchronous variant of :class:`Client` backed by ``httpx.AsyncClient``.
+
+    Every generated method is a coroutine, so independent requests can be issued
+    concurrently with ``asyncio.gather``. Requests share one connection pool
+    (multiplexed over HTTP/2 when ``h2`` is installed), and chunks of long
+    ranges are fetched concurrently, at most ``_MAX_WORKERS`` at a time.
+    As in :class:`Client`, 502/503/504 responses are retried with backoff and
+    requests never time out. The OpenAPI spec is still loaded synchronously
+    at init. Requires ``httpx`` (``pip install "isoview-client[async]"``).
+
+    Args:
+        api_key: Your ISOview API key.
+        base_url: Base URL of the API (default ``https://api.isoview.io/v1``).
+        cache: Same as :class:`Client`.
+        cache_fallback: Same as :class:`Client`.
+    """
+
+    def __init__(self, api_key: str, base_url: str = "https://api.isoview.io/v1",
+                 cache: bool = False, cache_fallback: bool = False):
+        import httpx
+
+        super().__init__(api_key, base_url, cache=cache, cache_fallback=cache_fallback)
+        # The requests session is only needed to load the spec
+        self._session.close()
+        # httpx only retries failed connections; gateway status retries happen in _get
+        transport = httpx.AsyncHTTPTransport(http2=importlib.util.find_spec("h2") is not None,
+                                             retries=_RETRY_TOTAL)
+        # No timeout, like requests in Client; httpx would otherwise cut slow chunks off at 5 seconds
+        self._http = httpx.AsyncClient(headers={"X-API-Key": api_key}, transport=transport, timeout=None)
+
+    async def _get(self, path: str, params: dict | None = None, is_list: bool = False) -> dict | list:
+        import httpx
+
+        url = f"{self._base_url}{path}"
+        params = {k: v for k, v in (params or {}).items() if v is not None} or None
+        cache_path = _response_cache_path(self._api_key, url, params) if self._cache else None
+        if cache_path:
+            cached = _read_cached_response(cache_path, _response_ttl(params, is_list))
+            if cached is not None:
+                return cached
+
+        try:
+            for attempt in range(_RETRY_TOTAL + 1):
+                resp = await self._http.get(url, params=params)
+                if resp.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    break
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+        except httpx.TransportError:
+            stale = self._read_stale(cache_path)
+            if stale is not None:
+                return stale
+            raise
+        if resp.status_code in _RETRY_STATUSES:
+            stale = self._read_stale(cache_path)
+            if stale is not None:
+                return stale
+        if resp.is_error:
+            # Match Client, which surfaces API errors as requests.HTTPError
+            raise requests.HTTPError(f"{resp.status_code} Error for url: {resp.url}", response=resp)
+        if cache_path:
+            _write_atomic(cache_path, resp.content)
+        return _json_loads(resp.content)
+
+    def _make_method(self, path_template, path_params, query_params,
+                     is_timeseries, is_list, has_chunking, resp_schema, schemas):
+
+        async def method(*args, **kwargs):
+            url_path, qp, output = _prepare_call(args, kwargs, path_template, path_params,
+                                                 query_params, is_timeseries)
+
+            if has_chunking and kwargs.get("start") is not None and kwargs.get("end") is not None:
+                data = await self._chunked_request(url_path, qp, kwargs["start"], kwargs["end"],
+                                                   resp_schema, schemas)
+            else:
+                data = await self._get(url_path, qp, is_list=is_list)
+                if is_timeseries:
+                    data = _parse_timeseries(data, resp_schema, schemas)
+                else:
+                    data = _parse_datetimes(data, resp_schema, schemas)
+            return _convert_output(data, output)
+
+        return method
+
+    async def _chunked_request(self, path, params, start, end, resp_schema, schemas):
+        windows = _chunk_windows(start, end, self._MAX_RANGE)
+        if windows is None:
+            data = await self._get(path, params)
+            return _parse_timeseries(data, resp_schema, schemas)
+
+        # Cap in-flight chunk requests like the thread pool in Client
+        semaphore = asyncio.Semaphore(self._MAX_WORKERS)
+
+        async def fetch(window):
+            try:
+                async with semaphore:
+                    data = await self._get(path, {**params, "start": window[0], "end": window[1]})
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 422:
+                    return None
+                raise
+            return _parse_timeseries(data, resp_schema, schemas)
+
+        results = await asyncio.gather(*(fetch(window) for window in windows))
+        chunks = [data for data in results if data is not None]
+        if not chunks:
+            raise ValueError(f"No data available for the requested time range ({windows[0][0]} to {windows[-1][1]})")
+        return _merge_timeseries_dicts(chunks)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
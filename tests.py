@@ -1,18 +1,92 @@
+import asyncio
+import json
+import math
 import os
+import tempfile
+from datetime import date, datetime, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
+import requests
 
-from isoview import Client
+from isoview import AsyncClient, Client, clear_cache
+from isoview.client import _load_spec, _response_cache_path, _response_ttl, _timeseries_to_arrow
 
-API_KEY = os.environ.get("ISOVIEW_API_KEY")
-if not API_KEY:
-    pytest.exit("Set the ISOVIEW_API_KEY environment variable to run tests", returncode=1)
 
+@pytest.fixture(scope="session")
+def api_key():
+    # Every live test depends on this fixture, so only the offline unit tests run without a key
+    key = os.environ.get("ISOVIEW_API_KEY")
+    if not key:
+        pytest.skip("Set the ISOVIEW_API_KEY environment variable to run live tests")
+    return key
 
-@pytest.fixture(scope="module")
-def client():
-    return Client(API_KEY)
+
+@pytest.fixture(scope="session")
+def client(api_key):
+    return Client(api_key)
+
+
+# Reference listings are fetched once per session and only feed the *_id fixtures below.
+# They rarely change, so they also persist across runs in the client's on-disk response cache
+# (30-day TTL); pass --no-isoview-cache to fetch them fresh. The list endpoint tests themselves
+# always call the API live through `client`.
+
+
+@pytest.fixture(scope="session")
+def listing_client(api_key, pytestconfig):
+    return Client(api_key, cache=not pytestconfig.getoption("no_isoview_cache", default=False))
+
+
+@pytest.fixture(scope="session")
+def pjm_demand_regions(listing_client: Client):
+    return listing_client.list_regions("pjm", "demand")
+
+
+@pytest.fixture(scope="session")
+def ercot_wind_plants(listing_client: Client):
+    return listing_client.list_plants("ercot", "wind")
+
+
+@pytest.fixture(scope="session")
+def isone_counties(listing_client: Client):
+    return listing_client.list_counties("isone")
+
+
+@pytest.fixture(scope="session")
+def gas_hubs(listing_client: Client):
+    return listing_client.list_gas_hubs()
+
+
+@pytest.fixture(scope="session")
+def pjm_dalmp_nodes(listing_client: Client):
+    return listing_client.list_lmp_nodes("pjm", "dalmp")
+
+
+@pytest.fixture(scope="session")
+def pjm_demand_region_id(pjm_demand_regions):
+    return pjm_demand_regions[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def ercot_wind_plant_id(ercot_wind_plants):
+    return str(ercot_wind_plants[0]["id"])
+
+
+@pytest.fixture(scope="session")
+def isone_county_id(isone_counties):
+    return isone_counties[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def gas_hub_id(gas_hubs):
+    return gas_hubs[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def pjm_dalmp_node_id(pjm_dalmp_nodes):
+    return pjm_dalmp_nodes[0]["id"]
 
 
 # ---------------------------------------------------------------------------
@@ -38,9 +112,14 @@ class TestListRegions:
         assert all(r["iso"] == "ercot" for r in regions)
 
 
+@pytest.fixture(scope="module")
+def pjm_demand_forecast(client: Client):
+    return client.get_regional_forecast("pjm", "demand")
+
+
 class TestRegionalForecast:
-    def test_returns_dict(self, client: Client):
-        ts = client.get_regional_forecast("pjm", "demand")
+    def test_returns_dict(self, pjm_demand_forecast):
+        ts = pjm_demand_forecast
         assert isinstance(ts, dict)
         assert ts["units"]
         assert ts["timezone"]
@@ -49,10 +128,8 @@ class TestRegionalForecast:
         assert len(ts["values"]) == len(ts["columns"])
         assert len(ts["columns"]) > 0
 
-    def test_with_specific_region(self, client: Client):
-        regions = client.list_regions("pjm", "demand")
-        region_id = regions[0]["id"]
-        ts = client.get_regional_forecast("pjm", "demand", id=region_id)
+    def test_with_specific_region(self, client: Client, pjm_demand_region_id):
+        ts = client.get_regional_forecast("pjm", "demand", id=pjm_demand_region_id)
         assert len(ts["columns"]) >= 1
 
     def test_as_df_utc(self, client: Client):
@@ -63,14 +140,24 @@ class TestRegionalForecast:
         assert isinstance(df.columns, pd.MultiIndex)
         assert df.shape[0] > 0
 
+    def test_as_arrow(self, client: Client):
+        pa = pytest.importorskip("pyarrow")
+        table = client.get_regional_forecast("pjm", "demand", as_arrow=True)
+        assert isinstance(table, pa.Table)
+        assert table.column_names[0] == "time"
+        assert table.num_rows > 0
+
     def test_as_df_returns_dict_when_false(self, client: Client):
         ts = client.get_regional_forecast("pjm", "demand", as_df=False)
         assert isinstance(ts, dict)
 
-    def test_datetime_parsing(self, client: Client):
-        ts = client.get_regional_forecast("pjm", "demand")
-        assert isinstance(ts["time_utc"][0], type(ts["time_utc"][0]))
-        assert isinstance(ts["created_at"], type(ts["created_at"]))
+    def test_datetime_parsing(self, pjm_demand_forecast):
+        ts = pjm_demand_forecast
+        assert isinstance(ts["time_utc"], pd.DatetimeIndex)
+        assert str(ts["time_utc"].tz) == "UTC"
+        assert isinstance(ts["time_local"], pd.DatetimeIndex)
+        assert str(ts["time_local"].tz) == ts["timezone"]
+        assert isinstance(ts["created_at"], datetime)
 
 
 class TestRegionalContinuousForecast:
@@ -97,11 +184,9 @@ class TestRegionalContinuousForecast:
 
 
 class TestRegionalEnsembleForecast:
-    def test_returns_dict(self, client: Client):
-        regions = client.list_regions("pjm", "demand")
-        region_id = regions[0]["id"]
+    def test_returns_dict(self, client: Client, pjm_demand_region_id):
         ts = client.get_ensemble_forecast(
-            "pjm", "demand", id=region_id, model="euro_ens",
+            "pjm", "demand", id=pjm_demand_region_id, model="euro_ens",
         )
         assert isinstance(ts, dict)
         assert len(ts["columns"]) > 1  # multiple ensemble members
@@ -113,9 +198,8 @@ class TestRegionalBackcast:
         assert isinstance(ts, dict)
         assert len(ts["time_utc"]) > 0
 
-    def test_chunked_request_with_date_range(self, client: Client):
-        regions = client.list_regions("pjm", "demand")
-        region_id = regions[0]["id"]
+    def test_chunked_request_with_date_range(self, client: Client, pjm_demand_region_id):
+        region_id = pjm_demand_region_id
         ts = client.get_region_day_ahead_backcast(
             "pjm", "demand",
             id=region_id,
@@ -124,6 +208,7 @@ class TestRegionalBackcast:
         )
         assert isinstance(ts, dict)
         assert len(ts["time_utc"]) > 0
+        assert ts["time_utc"].is_unique
         # DataFrame should work correctly via as_df
         df = client.get_region_day_ahead_backcast(
             "pjm", "demand",
@@ -133,7 +218,28 @@ class TestRegionalBackcast:
             as_df=True,
         )
         assert isinstance(df, pd.DataFrame)
-        assert df.shape[0] > 0
+        assert df.shape[0] == len(ts["time_utc"])
+
+    def test_chunked_request_with_date_bounds(self, client: Client, pjm_demand_region_id):
+        # Plain dates are accepted for both short and multi-year (chunked) ranges
+        short = client.get_region_day_ahead_backcast(
+            "pjm", "demand", id=pjm_demand_region_id,
+            start=date(2026, 1, 1), end=date(2026, 2, 1),
+        )
+        assert len(short["time_utc"]) > 0
+        long = client.get_region_day_ahead_backcast(
+            "pjm", "demand", id=pjm_demand_region_id,
+            start=date(2024, 1, 1), end=date(2026, 2, 1),
+        )
+        assert len(long["time_utc"]) > len(short["time_utc"])
+        assert long["time_utc"].is_unique
+        # A date may be mixed with an ISO string; the naive date is read as UTC midnight
+        mixed = client.get_region_day_ahead_backcast(
+            "pjm", "demand", id=pjm_demand_region_id,
+            start=date(2024, 1, 1), end="2026-02-01T00:00:00Z",
+        )
+        assert len(mixed["time_utc"]) == len(long["time_utc"])
+        assert mixed["time_utc"].is_unique
 
 
 class TestIsoSummary:
@@ -162,35 +268,6 @@ class TestListPlants:
         assert p["longitude"]
 
 
-class TestPlantForecast:
-    def test_returns_dict(self, client: Client):
-        plants = client.list_plants("ercot", "wind")
-        plant_id = plants[0]["id"]
-        ts = client.get_plant_forecast("ercot", "wind", id=str(plant_id))
-        assert isinstance(ts, dict)
-        assert len(ts["values"]) > 0
-
-
-class TestPlantContinuousForecast:
-    def test_returns_dict(self, client: Client):
-        plants = client.list_plants("ercot", "wind")
-        plant_id = plants[0]["id"]
-        ts = client.get_plant_continuous_forecast(
-            "ercot", "wind", id=str(plant_id), latest_hour=10, days_ahead=1,
-        )
-        assert isinstance(ts, dict)
-        assert len(ts["time_utc"]) > 0
-
-
-class TestPlantBackcast:
-    def test_returns_dict(self, client: Client):
-        plants = client.list_plants("ercot", "wind")
-        plant_id = plants[0]["id"]
-        ts = client.get_plant_day_ahead_backcast("ercot", "wind", id=str(plant_id))
-        assert isinstance(ts, dict)
-        assert len(ts["time_utc"]) > 0
-
-
 # ---------------------------------------------------------------------------
 # County endpoints
 # ---------------------------------------------------------------------------
@@ -209,26 +286,6 @@ class TestListCounties:
         assert isinstance(c["geojson"], dict)
 
 
-class TestCountyForecast:
-    def test_returns_dict(self, client: Client):
-        counties = client.list_counties("isone")
-        county_id = counties[0]["id"]
-        ts = client.get_county_forecast("isone", id=county_id)
-        assert isinstance(ts, dict)
-        assert len(ts["values"]) > 0
-
-
-class TestCountyContinuousForecast:
-    def test_returns_dict(self, client: Client):
-        counties = client.list_counties("isone")
-        county_id = counties[0]["id"]
-        ts = client.get_county_continuous_forecast(
-            "isone", id=county_id, latest_hour=10, days_ahead=1,
-        )
-        assert isinstance(ts, dict)
-        assert len(ts["time_utc"]) > 0
-
-
 # ---------------------------------------------------------------------------
 # Gas endpoints
 # ---------------------------------------------------------------------------
@@ -254,17 +311,6 @@ class TestGasForecast:
         assert len(ts["values"]) > 0
 
 
-class TestGasContinuousForecast:
-    def test_returns_dict(self, client: Client):
-        hubs = client.list_gas_hubs()
-        hub_id = hubs[0]["id"]
-        ts = client.get_continuous_gas_forecast(
-            id=hub_id, latest_hour=10, days_ahead=1,
-        )
-        assert isinstance(ts, dict)
-        assert len(ts["time_utc"]) > 0
-
-
 # ---------------------------------------------------------------------------
 # LMP endpoints
 # ---------------------------------------------------------------------------
@@ -283,24 +329,149 @@ class TestListLmpNodes:
         assert n["timezone"]
 
 
-class TestLmpForecast:
-    def test_returns_dict(self, client: Client):
-        nodes = client.list_lmp_nodes("pjm", "dalmp")
-        node_id = nodes[0]["id"]
-        ts = client.get_lmp_forecast("pjm", "dalmp", id=node_id)
+# ---------------------------------------------------------------------------
+# Entity forecasts (plants, counties, gas hubs, LMP nodes)
+# ---------------------------------------------------------------------------
+
+_CONTINUOUS = {"latest_hour": 10, "days_ahead": 1}
+
+_ENTITY_FORECASTS = [
+    ("get_plant_forecast", ("ercot", "wind"), "ercot_wind_plant_id", {}),
+    ("get_plant_continuous_forecast", ("ercot", "wind"), "ercot_wind_plant_id", _CONTINUOUS),
+    ("get_plant_day_ahead_backcast", ("ercot", "wind"), "ercot_wind_plant_id", {}),
+    ("get_county_forecast", ("isone",), "isone_county_id", {}),
+    ("get_county_continuous_forecast", ("isone",), "isone_county_id", _CONTINUOUS),
+    ("get_continuous_gas_forecast", (), "gas_hub_id", _CONTINUOUS),
+    ("get_lmp_forecast", ("pjm", "dalmp"), "pjm_dalmp_node_id", {}),
+    ("get_lmp_continuous_forecast", ("pjm", "dalmp"), "pjm_dalmp_node_id", _CONTINUOUS),
+]
+
+
+class TestEntityForecasts:
+    @pytest.mark.parametrize(
+        ("method", "args", "entity_id_fixture", "kwargs"),
+        _ENTITY_FORECASTS,
+        ids=[case[0] for case in _ENTITY_FORECASTS],
+    )
+    def test_returns_dict(self, client: Client, request, method, args, entity_id_fixture, kwargs):
+        # Id fixtures are session-scoped, so each entity id is looked up once for the whole matrix
+        entity_id = request.getfixturevalue(entity_id_fixture)
+        ts = getattr(client, method)(*args, id=entity_id, **kwargs)
         assert isinstance(ts, dict)
+        assert len(ts["time_utc"]) > 0
         assert len(ts["values"]) > 0
 
 
-class TestLmpContinuousForecast:
-    def test_returns_dict(self, client: Client):
-        nodes = client.list_lmp_nodes("pjm", "dalmp")
-        node_id = nodes[0]["id"]
-        ts = client.get_lmp_continuous_forecast(
-            "pjm", "dalmp", id=node_id, latest_hour=10, days_ahead=1,
-        )
-        assert isinstance(ts, dict)
-        assert len(ts["time_utc"]) > 0
+# ---------------------------------------------------------------------------
+# Async client
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncClient:
+    def test_concurrent_calls(self, api_key):
+        pytest.importorskip("httpx")
+
+        async def fetch():
+            async with AsyncClient(api_key) as aclient:
+                return await asyncio.gather(
+                    aclient.list_regions("pjm", "demand"),
+                    aclient.get_regional_forecast("pjm", "demand", as_df=True),
+                )
+
+        regions, df = asyncio.run(fetch())
+        assert len(regions) > 0
+        assert isinstance(df, pd.DataFrame)
+        assert df.shape[0] > 0
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def private_tmp(self, tmp_path, monkeypatch):
+        # Keep cache files out of the shared temp dir, where listing_client and other workers read them
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        return tmp_path
+
+    def test_listing_round_trips_through_disk(self, api_key, private_tmp):
+        cached = Client(api_key, cache=True)
+        spec = _load_spec(cached._base_url, requests.Session())
+        template = next(path for path, ops in spec["paths"].items()
+                        if ops.get("get", {}).get("summary") == "List Regions")
+        url = cached._base_url + template.format(iso="pjm", metric="demand")
+        path = _response_cache_path(api_key, url, None)
+        assert os.path.dirname(path) == str(private_tmp)
+
+        first = cached.list_regions("pjm", "demand")
+        assert os.path.exists(path)
+
+        # Overwrite the entry so a second call can only return this if it reads the file
+        with open(path, "w") as f:
+            json.dump([{"id": "from-cache"}], f)
+        assert cached.list_regions("pjm", "demand") == [{"id": "from-cache"}]
+
+        os.remove(path)
+        assert cached.list_regions("pjm", "demand") == first
+
+    def test_clear_cache_removes_only_isoview_files(self, private_tmp):
+        for name in ("isoview_spec_a.json", "isoview_response_b.json", "other.json"):
+            (private_tmp / name).write_text("{}")
+        clear_cache()
+        assert sorted(p.name for p in private_tmp.iterdir()) == ["other.json"]
+
+    @pytest.mark.parametrize("name", ["forecasted_by", "as_of", "end"])
+    def test_ttl_pinned_to_past_never_expires(self, name):
+        assert _response_ttl({name: "2020-01-01T00:00:00Z"}, is_list=False) == math.inf
+
+    @pytest.mark.parametrize("name", ["forecasted_by", "as_of", "end"])
+    def test_ttl_future_bound_is_short(self, name):
+        assert _response_ttl({name: "2999-01-01T00:00:00Z"}, is_list=False) == 60
+
+    def test_ttl_recent_end_is_short(self):
+        # Backcast data can still land shortly after a window ends
+        recent = (pd.Timestamp.now(tz="UTC") - pd.Timedelta(hours=1)).isoformat()
+        assert _response_ttl({"end": recent}, is_list=False) == 60
+        assert _response_ttl({"end": date.today().isoformat()}, is_list=False) == 60
+
+    def test_ttl_latest_and_list(self):
+        assert _response_ttl(None, is_list=False) == 60
+        assert _response_ttl(None, is_list=True) == 30 * 24 * 3600
+
+
+def _synthetic_timeseries(columns, values):
+    time_utc = pd.date_range("2026-01-01", periods=len(values[0]), freq="h", tz="UTC")
+    return {
+        "units": "MW",
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "time_utc": time_utc,
+        "time_local": time_utc.tz_convert("America/New_York"),
+        "columns": columns,
+        "values": np.array(values, dtype="float64"),
+    }
+
+
+class TestArrowConversion:
+    def test_nan_becomes_null(self):
+        pytest.importorskip("pyarrow")
+        table = _timeseries_to_arrow(_synthetic_timeseries([["pjm", "forecast"]], [[1.0, np.nan, 3.0]]))
+        assert table.column("pjm_forecast").null_count == 1
+        assert table.column("pjm_forecast").to_pylist() == [1.0, None, 3.0]
+
+    @pytest.mark.parametrize("columns", [[["pjm_total", "f"], ["pjm", "total_f"]], [["time"], ["pjm"]]])
+    def test_colliding_column_names_raise(self, columns):
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="Duplicate Arrow column name"):
+            _timeseries_to_arrow(_synthetic_timeseries(columns, [[1.0], [2.0]]))
+
+    def test_metadata_is_json(self):
+        pytest.importorskip("pyarrow")
+        table = _timeseries_to_arrow(_synthetic_timeseries([["pjm", "forecast"]], [[1.0]]))
+        metadata = {k.decode(): json.loads(v) for k, v in table.schema.metadata.items()}
+        assert metadata["units"] == "MW"
+        assert datetime.fromisoformat(metadata["created_at"]) == datetime(2026, 1, 1, tzinfo=timezone.utc)
 
 
 # ---------------------------------------------------------------------------